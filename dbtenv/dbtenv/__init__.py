@@ -1,8 +1,8 @@
 # Standard library
 from abc import ABC as AbstractBaseClass, abstractmethod
 import argparse
-import distutils.version
 from enum import Enum
+import functools
 import logging
 import os
 import os.path
@@ -10,16 +10,18 @@ import platform
 import re
 import subprocess
 import sys
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 DEFAULT_VENVS_DIRECTORY = os.path.normpath('~/.dbt/versions')
+DEFAULT_CACHE_DIRECTORY = os.path.normpath('~/.dbt/dbtenv_cache')
 
 GLOBAL_VERSION_FILE = os.path.normpath('~/.dbt/version')
 LOCAL_VERSION_FILE  = '.dbt_version'
 DBT_VERSION_VAR     = 'DBT_VERSION'
 
 AUTO_INSTALL_VAR          = 'DBTENV_AUTO_INSTALL'
+CACHE_DIRECTORY_VAR       = 'DBTENV_CACHE_DIRECTORY'
 DEBUG_VAR                 = 'DBTENV_DEBUG'
 DEFAULT_INSTALLER_VAR     = 'DBTENV_DEFAULT_INSTALLER'
 PYTHON_VAR                = 'DBTENV_PYTHON'
@@ -27,11 +29,23 @@ QUIET_VAR                 = 'DBTENV_QUIET'
 SIMULATE_RELEASE_DATE_VAR = 'DBTENV_SIMULATE_RELEASE_DATE'
 VENVS_DIRECTORY_VAR       = 'DBTENV_VENVS_DIRECTORY'
 
+PIP_SPECIFIER_PATTERN  = re.compile(r'^(dbt-.+)==(.+)$')
+VERSION_NUMBER_PATTERN = re.compile(r'^[0-9\.]+[a-z0-9]*$')
+
 
 def string_is_true(value: str) -> bool:
     return value.strip().lower() in ('1', 'active', 'enable', 'enabled', 'on', 't', 'true', 'y', 'yes')
 
 
+def confirm(prompt: str) -> bool:
+    try:
+        return string_is_true(input(prompt))
+    except EOFError:
+        # There's no more input to answer the prompt with (e.g. when running non-interactively), so don't confirm.
+        print()
+        return False
+
+
 LOGGER = logging.getLogger('dbtenv')
 output_handler = logging.StreamHandler()
 output_handler.setFormatter(logging.Formatter('{name} {levelname}:  {message}', style='{'))
@@ -63,16 +77,18 @@ class Args(argparse.Namespace):
 
 class Installer(Enum):
     PIP      = 'pip'
+    UV       = 'uv'
 
     def __str__(self) -> str:
         return self.value
 
 
-class Version(distutils.version.LooseVersion):
+@functools.total_ordering
+class Version:
     def __init__(self, pip_specifier: str = None, adapter_type: str = None, version: str = None, source: Optional[str] = None, source_description: Optional[str] = None) -> None:
         if pip_specifier:
             self.pip_specifier = pip_specifier
-            self.name, self.version = re.match(r"^(dbt-.+)==(.+)$", pip_specifier).groups()
+            self.name, self.version = PIP_SPECIFIER_PATTERN.match(pip_specifier).groups()
             self.adapter_type = self.name.replace("dbt-", "")
             self.pypi_version = self.version
         else:
@@ -89,16 +105,33 @@ class Version(distutils.version.LooseVersion):
         self.is_semantic = version_match is not None
         self.is_stable = version_match is not None and not version_match['prerelease']
         self.major_minor_patch = version_match['version'] if version_match is not None else None
+        # Comparing version number tuples avoids string comparison pitfalls like '0.100' < '0.20'.
+        self.major_minor_patch_tuple: Optional[Tuple[int, int, int]] = (
+            tuple(int(part) for part in self.major_minor_patch.split('.')) if self.major_minor_patch is not None else None
+        )
         self.prerelease = version_match['prerelease'] if version_match is not None else None
 
         # dbt pre-release versions are formatted slightly differently.
         if version_match and version_match['prerelease']:
             self.pypi_version     = f"{version_match['version']}{version_match['prerelease']}"
 
-        super().__init__(self.pypi_version)
+        # Semantic versions are ordered by their version numbers, with pre-releases before the corresponding release,
+        # so e.g. 1.10.0 is correctly ordered after 1.9.0.  Other versions can only be ordered as strings, before any
+        # semantic versions.
+        if version_match is None:
+            self._sort_key: Tuple[Any, ...] = (self.name, 0, self.pypi_version)
+        elif self.prerelease:
+            prerelease_match = re.match(r'(?P<label>[a-z]+)\.?(?P<number>\d*)(?P<rest>.*)', self.prerelease)
+            self._sort_key = (
+                self.name, 1, self.major_minor_patch_tuple, 0,
+                (prerelease_match['label'], int(prerelease_match['number'] or 0), prerelease_match['rest'])
+            )
+        else:
+            # Any suffix (e.g. `.post1`) orders the version after the plain release.
+            self._sort_key = (self.name, 1, self.major_minor_patch_tuple, 1, self.pypi_version[version_match.end('version'):])
 
     def __hash__(self) -> int:
-        return self.pypi_version.__hash__()
+        return hash(self._sort_key)
 
     def __str__(self) -> str:
         return self.pip_specifier
@@ -106,17 +139,15 @@ class Version(distutils.version.LooseVersion):
     def __repr__(self) -> str:
         return f"Version('{self.pip_specifier}')"
 
-    def _cmp(self, other: 'Position') -> int:
-        if self.name < other.name:
-            return -1
-        if self.name > other.name:
-            return 1
-        if self.pypi_version == other.pypi_version:
-            return 0
-        if self.pypi_version < other.pypi_version:
-            return -1
-        if self.pypi_version > other.pypi_version:
-            return 1
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._sort_key == other._sort_key
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._sort_key < other._sort_key
 
     @property
     def source(self):
@@ -142,13 +173,22 @@ class Environment:
 
         self.working_directory = os.getcwd()
 
-        self.project_file = self.find_file_along_working_path('dbt_project.yml')
-        self.project_directory = os.path.dirname(self.project_file) if self.project_file else None
-
         self.venvs_directory = os.path.expanduser(self.env_vars.get(VENVS_DIRECTORY_VAR) or DEFAULT_VENVS_DIRECTORY)
 
+        self.cache_directory = os.path.expanduser(self.env_vars.get(CACHE_DIRECTORY_VAR) or DEFAULT_CACHE_DIRECTORY)
+
         self.global_version_file = os.path.expanduser(GLOBAL_VERSION_FILE)
 
+    @property
+    def project_file(self) -> Optional[str]:
+        # Only search for the dbt project file when it's actually needed.
+        return self.find_file_along_working_path('dbt_project.yml')
+
+    @property
+    def project_directory(self) -> Optional[str]:
+        project_file = self.project_file
+        return os.path.dirname(project_file) if project_file else None
+
     _debug: Optional[bool] = None
 
     @property
@@ -195,7 +235,17 @@ class Environment:
 
     @property
     def default_installer(self) -> Installer:
-        self._default_installer = Installer.PIP
+        if self._default_installer is None:
+            if DEFAULT_INSTALLER_VAR in self.env_vars:
+                installer_name = self.env_vars[DEFAULT_INSTALLER_VAR].strip().lower()
+                try:
+                    self._default_installer = Installer(installer_name)
+                except ValueError:
+                    raise DbtenvError(
+                        f"Invalid {DEFAULT_INSTALLER_VAR} value \"{installer_name}\", expected one of {[str(installer) for installer in Installer]}."
+                    )
+            else:
+                self._default_installer = Installer.PIP
 
         return self._default_installer
 
@@ -215,7 +265,7 @@ class Environment:
 
     @property
     def use_pip(self) -> bool:
-        return not self.installer or self.installer == Installer.PIP
+        return self.primary_installer in (Installer.PIP, Installer.UV)
 
     _python: Optional[str] = None
 
@@ -271,12 +321,23 @@ class Environment:
     def simulate_release_date(self, value: bool) -> None:
         self._simulate_release_date = value
 
+    _found_files_along_working_path: Optional[Dict[str, Optional[str]]] = None
+
     def find_file_along_working_path(self, file_name: str) -> Optional[str]:
+        # Searching every directory up to the root can take a lot of file system calls, so each file name's result
+        # (including not finding it) is remembered for the rest of the run.
+        if self._found_files_along_working_path is None:
+            self._found_files_along_working_path = {}
+        if file_name in self._found_files_along_working_path:
+            return self._found_files_along_working_path[file_name]
+
+        found_file_path = None
         search_dir = self.working_directory
         while True:
             file_path = os.path.join(search_dir, file_name)
             if os.path.isfile(file_path):
-                return file_path
+                found_file_path = file_path
+                break
 
             parent_dir = os.path.dirname(search_dir)
             if parent_dir == search_dir:
@@ -284,7 +345,8 @@ class Environment:
 
             search_dir = parent_dir
 
-        return None
+        self._found_files_along_working_path[file_name] = found_file_path
+        return found_file_path
 
 
 class Subcommand(AbstractBaseClass):
@@ -293,8 +355,9 @@ class Subcommand(AbstractBaseClass):
     def __init__(self, env: Environment) -> None:
         self.env = env
 
+    @classmethod
     @abstractmethod
-    def add_args_parser(self, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
+    def add_args_parser(cls, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
         pass
 
     @abstractmethod
@@ -1,6 +1,5 @@
 # Standard library
 import argparse
-import re
 from typing import List
 
 # Local
@@ -20,17 +19,18 @@ class ExecuteSubcommand(Subcommand):
     name = 'execute'
     aliases = ['exec']
 
-    def add_args_parser(self, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
+    @classmethod
+    def add_args_parser(cls, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
         parser = subparsers.add_parser(
-            self.name,
-            aliases=self.aliases,
+            cls.name,
+            aliases=cls.aliases,
             parents=parent_parsers,
             description=f"""
                 Execute a dbt command using the specified dbt version or the dbt version automatically detected from the
                 environment based on the global `{dbtenv.GLOBAL_VERSION_FILE}` file, local `{dbtenv.LOCAL_VERSION_FILE}` files,
                 or {dbtenv.DBT_VERSION_VAR} environment variable.
             """,
-            help=self.__doc__
+            help=cls.__doc__
         )
         parser.add_argument(
             '--dbt',
@@ -62,9 +62,9 @@ class ExecuteSubcommand(Subcommand):
 
         adapter_type, no_adapter_type_reason = dbtenv.version.try_get_project_adapter_type(self.env.project_file, target_name=arg_target_name)
         if args.dbt_version_specifier:
-            if bool(re.search(r"^(dbt-.+)==(.+)$", args.dbt_version_specifier)):
+            if bool(dbtenv.PIP_SPECIFIER_PATTERN.search(args.dbt_version_specifier)):
                 version = Version(pip_specifier=args.dbt_version_specifier, source_description="specified using --dbt arg")
-            elif bool(re.search(r"^[0-9\.]+[a-z0-9]*$", args.dbt_version_specifier)):
+            elif bool(dbtenv.VERSION_NUMBER_PATTERN.search(args.dbt_version_specifier)):
                 if not adapter_type:
                     logger.info(f"Could not determine adapter type as {no_adapter_type_reason} and no full pip specifier set in dbtenv's configuration.")
                     return
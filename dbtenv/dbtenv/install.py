@@ -5,9 +5,7 @@ from typing import List
 # Local
 import dbtenv
 from dbtenv import Args, DbtenvError, Environment, Installer, Subcommand, Version
-import dbtenv.pip
 import dbtenv.version
-import dbtenv.which
 
 
 logger = dbtenv.LOGGER
@@ -20,12 +18,13 @@ class InstallSubcommand(Subcommand):
 
     name = 'install'
 
-    def add_args_parser(self, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
+    @classmethod
+    def add_args_parser(cls, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
         parser = subparsers.add_parser(
-            self.name,
+            cls.name,
             parents=parent_parsers,
-            description=self.__doc__,
-            help=self.__doc__
+            description=cls.__doc__,
+            help=cls.__doc__
         )
         parser.add_argument(
             '-f',
@@ -64,6 +63,8 @@ class InstallSubcommand(Subcommand):
         )
 
     def execute(self, args: Args) -> None:
+        import dbtenv.pip
+
         if args.dbt_pip_specifier:
             dbt_pip_specifier = args.dbt_pip_specifier
         else:
@@ -77,11 +78,13 @@ class InstallSubcommand(Subcommand):
 
 
 def install_dbt(env: Environment, version: Version) -> None:
+    import dbtenv.pip
     dbtenv.pip.PipDbt(env, version).install()
 
 
 def ensure_dbt_is_installed(env: Environment, version: Version) -> None:
-    if not dbtenv.which.try_get_dbt(env, version):
+    import dbtenv.pip
+    if not dbtenv.pip.PipDbt(env, version).is_installed():
         if env.auto_install:
             install_dbt(env, version)
         else:
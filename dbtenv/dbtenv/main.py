@@ -1,19 +1,15 @@
 # Standard library
 import argparse
 from enum import IntEnum
+import functools
+import importlib
+import os.path
 import sys
-import importlib.metadata
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 # Local
 import dbtenv
-from dbtenv import Args, DbtenvError, DbtError, Environment, Installer
-import dbtenv.execute
-import dbtenv.install
-import dbtenv.uninstall
-import dbtenv.version
-import dbtenv.versions
-import dbtenv.which
+from dbtenv import Args, DbtenvError, DbtError, Environment, Subcommand
 
 
 logger = dbtenv.LOGGER
@@ -25,8 +21,53 @@ class ExitCode(IntEnum):
     INTERRUPTED = 2
 
 
-def build_root_args_parser(env: Environment) -> argparse.ArgumentParser:
-    common_args_parser = build_common_args_parser(env)
+# Sub-command names (including aliases) mapped to the module and class implementing them, so sub-command modules are
+# only imported once we know which one is needed.
+SUBCOMMANDS: Dict[str, Tuple[str, str]] = {
+    'versions':  ('dbtenv.versions', 'VersionsSubcommand'),
+    'install':   ('dbtenv.install', 'InstallSubcommand'),
+    'version':   ('dbtenv.version', 'VersionSubcommand'),
+    'which':     ('dbtenv.which', 'WhichSubcommand'),
+    'execute':   ('dbtenv.execute', 'ExecuteSubcommand'),
+    'exec':      ('dbtenv.execute', 'ExecuteSubcommand'),
+    'uninstall': ('dbtenv.uninstall', 'UninstallSubcommand'),
+}
+
+
+# Arguments which override the environment settings of the same name when specified.  Not every sub-command has all of
+# them, and debug needs to be first so it takes effect as soon as possible.
+ENVIRONMENT_ARG_NAMES = ('debug', 'quiet', 'python', 'simulate_release_date')
+
+
+def get_subcommand_class(name: str) -> Type[Subcommand]:
+    if name not in SUBCOMMANDS:
+        raise DbtenvError(f"Unknown sub-command `{name}`.")
+    module_name, class_name = SUBCOMMANDS[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_dbtenv_version() -> str:
+    # importlib.metadata is only imported when the version is actually needed, as it's relatively slow to import.
+    import importlib.metadata
+    try:
+        return importlib.metadata.version('dbtenv')
+    except importlib.metadata.PackageNotFoundError:
+        raise DbtenvError("No installed dbtenv package metadata found.")
+
+
+class VersionAction(argparse.Action):
+    """Show the dbtenv version and exit, only looking the version up if the argument is actually used."""
+
+    def __init__(self, option_strings: List[str], dest: str = argparse.SUPPRESS, default: str = argparse.SUPPRESS, help: Optional[str] = None) -> None:
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser: argparse.ArgumentParser, namespace: argparse.Namespace, values: Any, option_string: Optional[str] = None) -> None:
+        print(f"{parser.prog} {get_dbtenv_version()}")
+        parser.exit()
+
+
+def build_root_args_parser() -> argparse.ArgumentParser:
+    common_args_parser = build_common_args_parser()
     root_args_parser = argparse.ArgumentParser(
         description=f"""
             Lets you easily install and run multiple versions of dbt using pip with Python virtual environments.
@@ -41,19 +82,21 @@ def build_root_args_parser(env: Environment) -> argparse.ArgumentParser:
     )
     root_args_parser.add_argument(
         '--version',
-        action='version',
-        version=f'%(prog)s {importlib.metadata.version("dbtenv")}',
+        action=VersionAction,
         help="Show %(prog)s version and exit."
     )
     return root_args_parser
 
 
-def build_common_args_parser(env: Environment, dest_prefix: str = '') -> argparse.ArgumentParser:
+def build_common_args_parser(for_subcommand: bool = False) -> argparse.ArgumentParser:
+    # Sub-command parsers share the same destinations as the root parser, so they mustn't set any defaults which
+    # would overwrite values already parsed by the root parser.
+    default = argparse.SUPPRESS if for_subcommand else None
     common_args_parser = argparse.ArgumentParser(add_help=False)
     common_args_parser.add_argument(
         '--debug',
-        dest=f'{dest_prefix}debug',
         action='store_const',
+        default=default,
         const=True,
         help=f"""
             Output debug information as dbtenv runs.
@@ -62,8 +105,8 @@ def build_common_args_parser(env: Environment, dest_prefix: str = '') -> argpars
     )
     common_args_parser.add_argument(
         '--quiet',
-        dest=f'{dest_prefix}quiet',
         action='store_const',
+        default=default,
         const=True,
         help=f"""
             Don't output any nonessential information as dbtenv runs.
@@ -74,7 +117,7 @@ def build_common_args_parser(env: Environment, dest_prefix: str = '') -> argpars
     return common_args_parser
 
 
-def build_common_install_args_parser(env: Environment) -> argparse.ArgumentParser:
+def build_common_install_args_parser() -> argparse.ArgumentParser:
     common_install_args_parser = argparse.ArgumentParser(add_help=False)
     common_install_args_parser.add_argument(
         '--python',
@@ -98,6 +141,72 @@ def build_common_install_args_parser(env: Environment) -> argparse.ArgumentParse
     return common_install_args_parser
 
 
+@functools.lru_cache(maxsize=None)
+def build_args_parser(subcommand: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the args parser, only including the specified sub-command's parser if there is one, so that only that
+    sub-command's module needs to be imported.
+    """
+    # The args parser doesn't depend on the environment, so it only needs to be built once per process.
+    args_parser = build_root_args_parser()
+    subparsers = args_parser.add_subparsers(dest='subcommand', title="Sub-commands")
+    common_subcommand_args_parser = build_common_args_parser(for_subcommand=True)
+    common_install_args_parser = build_common_install_args_parser()
+    subcommand_parent_parsers = {
+        'versions':  [common_subcommand_args_parser],
+        'install':   [common_subcommand_args_parser, common_install_args_parser],
+        'version':   [common_subcommand_args_parser, common_install_args_parser],
+        'which':     [common_subcommand_args_parser],
+        'execute':   [common_subcommand_args_parser, common_install_args_parser],
+        'uninstall': [common_subcommand_args_parser],
+    }
+    for name, parent_parsers in subcommand_parent_parsers.items():
+        if subcommand is None or SUBCOMMANDS[subcommand] == SUBCOMMANDS[name]:
+            get_subcommand_class(name).add_args_parser(subparsers, parent_parsers)
+    return args_parser
+
+
+def sniff_subcommand(args: List[str]) -> Optional[str]:
+    """Get the sub-command name from the arguments without fully parsing them, if it's a known sub-command."""
+    # None of the root parser's options take values, so the first argument that isn't an option is the sub-command.
+    for arg in args:
+        if not arg.startswith('-'):
+            return arg if arg in SUBCOMMANDS else None
+    return None
+
+
+def try_parse_fast_path_args(args: List[str]) -> Optional[Args]:
+    """
+    Parse the most common argument shapes without building the full args parser, returning None for anything else.
+
+    The parsed args must match what the full args parser would produce for the same arguments.
+    """
+    common_args = dict(debug=None, quiet=None)
+    if len(args) >= 2 and args[0] in ('execute', 'exec') and args[1] == '--':
+        return Args(
+            subcommand=args[0],
+            **common_args,
+            python=None,
+            simulate_release_date=None,
+            dbt_version_specifier=None,
+            dbt_args=args[2:]
+        )
+    if args == ['version']:
+        return Args(
+            subcommand=args[0],
+            **common_args,
+            python=None,
+            simulate_release_date=None,
+            global_dbt_version=None,
+            local_dbt_version=None,
+            project_dbt_version=None,
+            shell_dbt_version=None
+        )
+    if args == ['which']:
+        return Args(subcommand=args[0], **common_args, dbt_version=None)
+    return None
+
+
 def main(args: List[str] = None) -> None:
     try:
         if args is None:
@@ -107,71 +216,36 @@ def main(args: List[str] = None) -> None:
 
         env = Environment()
 
-        versions_subcommand = dbtenv.versions.VersionsSubcommand(env)
-        install_subcommand = dbtenv.install.InstallSubcommand(env)
-        version_subcommand = dbtenv.version.VersionSubcommand(env)
-        which_subcommand = dbtenv.which.WhichSubcommand(env)
-        execute_subcommand = dbtenv.execute.ExecuteSubcommand(env)
-        uninstall_subcommand = dbtenv.uninstall.UninstallSubcommand(env)
-
-        args_parser = build_root_args_parser(env)
-        subparsers = args_parser.add_subparsers(dest='subcommand', title="Sub-commands")
-        common_subcommand_args_parser = build_common_args_parser(env, dest_prefix='subcommand_')
-        common_install_args_parser = build_common_install_args_parser(env)
-        versions_subcommand.add_args_parser(subparsers, [common_subcommand_args_parser])
-        install_subcommand.add_args_parser(subparsers, [common_subcommand_args_parser, common_install_args_parser])
-        version_subcommand.add_args_parser(subparsers, [common_subcommand_args_parser, common_install_args_parser])
-        which_subcommand.add_args_parser(subparsers, [common_subcommand_args_parser])
-        execute_subcommand.add_args_parser(subparsers, [common_subcommand_args_parser, common_install_args_parser])
-        uninstall_subcommand.add_args_parser(subparsers, [common_subcommand_args_parser])
-
-        parsed_args = Args()
-        if args_parser.prog == 'dbt':
+        if os.path.basename(sys.argv[0]) == 'dbt':
             # If the dbt entrypoint has been used, prefix the args with the execute subcommand
             args = ['execute', '--'] + args
-        args_parser.parse_args(args, namespace=parsed_args)
-
-        debug = parsed_args.debug or parsed_args.get('subcommand_debug')
-        if debug:
-            env.debug = debug
-
-        logger.debug(f"Parsed arguments = {parsed_args}")
 
-        quiet = parsed_args.quiet or parsed_args.get('subcommand_quiet')
-        if quiet:
-            env.quiet = quiet
+        if not args:
+            build_args_parser().print_help()
+            sys.exit(ExitCode.FAILURE)
+        if args == ['--version']:
+            # Same output as the args parser's --version action, but without having to build the args parser.
+            print(f"{os.path.basename(sys.argv[0])} {get_dbtenv_version()}")
+            sys.exit(ExitCode.SUCCESS)
 
-        installer = parsed_args.get('installer') or parsed_args.get('subcommand_installer')
-        if installer:
-            env.installer = installer
+        parsed_args = try_parse_fast_path_args(args)
+        if parsed_args is None:
+            parsed_args = Args()
+            build_args_parser(sniff_subcommand(args)).parse_args(args, namespace=parsed_args)
 
-        python = parsed_args.get('python')
-        if python:
-            env.python = python
+        for arg_name in ENVIRONMENT_ARG_NAMES:
+            arg_value = getattr(parsed_args, arg_name, None)
+            if arg_value:
+                setattr(env, arg_name, arg_value)
 
-        simulate_release_date = parsed_args.get('simulate_release_date')
-        if simulate_release_date:
-            env.simulate_release_date = simulate_release_date
+        logger.debug(f"Parsed arguments = {parsed_args}")
 
         subcommand = parsed_args.subcommand
         if not subcommand:
-            args_parser.print_help()
+            build_args_parser().print_help()
             sys.exit(ExitCode.FAILURE)
 
-        if subcommand == versions_subcommand.name:
-            versions_subcommand.execute(parsed_args)
-        elif subcommand == install_subcommand.name:
-            install_subcommand.execute(parsed_args)
-        elif subcommand == version_subcommand.name:
-            version_subcommand.execute(parsed_args)
-        elif subcommand == which_subcommand.name:
-            which_subcommand.execute(parsed_args)
-        elif subcommand == execute_subcommand.name or subcommand in execute_subcommand.aliases:
-            execute_subcommand.execute(parsed_args)
-        elif subcommand == uninstall_subcommand.name:
-            uninstall_subcommand.execute(parsed_args)
-        else:
-            raise DbtenvError(f"Unknown sub-command `{subcommand}`.")
+        get_subcommand_class(subcommand)(env).execute(parsed_args)
     except DbtenvError as error:
         logger.error(error)
         sys.exit(ExitCode.FAILURE)
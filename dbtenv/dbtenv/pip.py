@@ -1,20 +1,19 @@
 # Standard library
-from datetime import date
-import http
-import http.server
-import json
+import functools
+import itertools
 import os
 import os.path
-import re
+import platform
 import shutil
 import subprocess
+import sys
 import threading
-from typing import List, Optional, Union
-import urllib.request
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Local
 import dbtenv
-from dbtenv import Dbt, DbtenvError, Environment, Version
+from dbtenv import Dbt, DbtenvError, Environment, Installer, Version
 
 
 logger = dbtenv.LOGGER
@@ -42,35 +41,280 @@ DBT_ADAPTER_TYPES = [
     'vertica',
 ]
 
+# dbt versions prior to 0.19.1 just specified agate>=1.6, but agate 1.6.2 introduced a dependency on PyICU which causes
+# installation problems, so those versions need an explicit constraint excluding it like versions 0.19.1 and above do.
+AGATE_CONSTRAINT = 'agate>=1.6,<1.6.2'
+AGATE_CONSTRAINT_BEFORE_VERSION = (0, 19, 1)
+
+
+def version_is_before(version: Version, other_major_minor_patch: Tuple[int, int, int]) -> bool:
+    if version.major_minor_patch_tuple is None:
+        # Versions which aren't semantic versions can only be compared as strings.
+        return version.pypi_version < '.'.join(str(part) for part in other_major_minor_patch)
+    return version.major_minor_patch_tuple < other_major_minor_patch
+
 
 def get_installed_pip_dbt_versions(env: Environment, adapter_type: Optional[str] = None) -> List[Version]:
-    if not os.path.isdir(env.venvs_directory):
-        return []
     versions = []
-    for entry in os.scandir(env.venvs_directory):
-        if entry.is_dir() and bool(re.search(r"^(dbt-.+)==(.+)$", entry.name)) and (not adapter_type or entry.name.startswith(f"dbt-{adapter_type}==")):
-            versions.append(
-                Version(pip_specifier=entry.name)
-            )
+    # Checking the name prefix is much cheaper than the full pattern, so it's done first.
+    name_prefix = f"dbt-{adapter_type}==" if adapter_type else "dbt-"
+    try:
+        with os.scandir(env.venvs_directory) as venvs_directory_scan:
+            for entry in venvs_directory_scan:
+                if entry.name.startswith(name_prefix) and bool(dbtenv.PIP_SPECIFIER_PATTERN.search(entry.name)) and entry.is_dir():
+                    versions.append(
+                        Version(pip_specifier=entry.name)
+                    )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
     return versions
 
 
-def get_pypi_package_metadata(package: str) -> str:
-    package_json_url = f'https://pypi.org/pypi/{package}/json'
-    logger.debug(f"Fetching {package} package metadata from {package_json_url}.")
-    with urllib.request.urlopen(package_json_url) as package_json_response:
-        return json.load(package_json_response)
+PYPI_HOST = 'pypi.org'
+PYPI_MAX_CONCURRENT_REQUESTS = 8
+# pypi.org only redirects to itself or to its files host, and never more than a couple of times.
+PYPI_REDIRECT_HOSTS = (PYPI_HOST, 'files.pythonhosted.org')
+PYPI_MAX_REDIRECTS = 3
+
+_pypi_connections = threading.local()
+
+
+def get_pypi_connections() -> Dict[str, 'http.client.HTTPSConnection']:
+    """Get the current thread's kept-alive connections, keyed by host."""
+    if not hasattr(_pypi_connections, 'connections'):
+        _pypi_connections.connections = {}
+    return _pypi_connections.connections
+
+
+def get_pypi_response(
+    path: str,
+    headers: Optional[Dict[str, str]] = None,
+    host: str = PYPI_HOST,
+    max_redirects: int = PYPI_MAX_REDIRECTS
+) -> Tuple['http.client.HTTPResponse', bytes]:
+    """Get a pypi.org response and its body, reusing a kept-alive connection for each thread."""
+    # http.client (and the email and ssl modules it uses) and the other modules only needed to talk to pypi.org are only
+    # imported when dbtenv actually needs pypi.org, so running an installed dbt version doesn't have to import them.
+    import gzip
+    import http.client
+    import urllib.parse
+
+    connections = get_pypi_connections()
+    for attempt in range(2):
+        connection = connections.get(host)
+        if connection is None:
+            connection = http.client.HTTPSConnection(host)
+            connections[host] = connection
+        try:
+            # Package metadata compresses very well, so ask for it gzipped.
+            connection.request('GET', path, headers={**(headers or {}), 'Accept-Encoding': 'gzip'})
+            response = connection.getresponse()
+            body = response.read()
+            break
+        except (http.client.HTTPException, ConnectionError):
+            # pypi.org may have closed the kept-alive connection, in which case we retry once with a new connection.
+            connection.close()
+            del connections[host]
+            if attempt > 0:
+                raise
+
+    url = f'https://{host}{path}'
+    if response.status in (http.HTTPStatus.MOVED_PERMANENTLY, http.HTTPStatus.FOUND, http.HTTPStatus.TEMPORARY_REDIRECT, http.HTTPStatus.PERMANENT_REDIRECT):
+        redirect_url = urllib.parse.urljoin(url, response.headers.get('Location', ''))
+        redirect = urllib.parse.urlsplit(redirect_url)
+        if max_redirects <= 0:
+            raise DbtenvError(f"Request to {url} failed because of too many redirects.")
+        if redirect.scheme != 'https' or redirect.hostname not in PYPI_REDIRECT_HOSTS:
+            raise DbtenvError(f"Request to {url} failed because of an unexpected redirect to {redirect_url}.")
+        redirect_path = f'{redirect.path}?{redirect.query}' if redirect.query else redirect.path
+        return get_pypi_response(redirect_path, headers, redirect.hostname, max_redirects - 1)
+    if response.status not in (http.HTTPStatus.OK, http.HTTPStatus.NOT_MODIFIED):
+        raise DbtenvError(f"Request to {url} failed with status {response.status}.")
+    if response.headers.get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    return response, body
+
+
+# pypi.org allows its package metadata responses to be cached for 15 minutes.
+PYPI_PACKAGE_METADATA_MAX_AGE_SECONDS = 15 * 60
+
+
+def read_cached_pypi_package_json(cache_file: str) -> Optional[Tuple[float, str, bytes]]:
+    """Return the cache file's modification time, ETag, and package metadata, or None if it can't be read."""
+    try:
+        with open(cache_file, 'rb') as file:
+            modified_time = os.fstat(file.fileno()).st_mtime
+            contents = file.read()
+    except OSError:
+        return None
+    # The ETag is stored on the first line, so it's always replaced together with the metadata it belongs to.
+    etag, _, package_json = contents.partition(b'\n')
+    return modified_time, etag.decode('latin-1'), package_json
+
+
+def get_cached_pypi_package_json(env: Environment, package: str, revalidate: bool = False) -> bytes:
+    """
+    Get a package's pypi.org JSON metadata, using the copy cached on disk if it's recent or unchanged on pypi.org.
 
-def get_pypi_package_versions(adapter_type: str) -> List[Version]:
-    package_metadata = get_pypi_package_metadata(f"dbt-{adapter_type}")
-    possible_versions = ((Version(adapter_type=adapter_type, version=version), files) for version, files in package_metadata['releases'].items())
-    return [version for version, files in possible_versions if any(not file['yanked'] for file in files)]
+    If revalidate is true the cached copy is checked with pypi.org even if it's recent.
+    """
+    import http
+    import tempfile
+
+    package_json_path = f'/pypi/{package}/json'
+    cache_file = os.path.join(env.cache_directory, 'pypi', f'{package}.cache')
+
+    request_headers = {}
+    cached_package_json = read_cached_pypi_package_json(cache_file)
+    if cached_package_json is not None:
+        cache_modified_time, cache_etag, cache_body = cached_package_json
+        if not revalidate and time.time() - cache_modified_time < PYPI_PACKAGE_METADATA_MAX_AGE_SECONDS:
+            logger.debug(f"Using {package} package metadata cached in `{cache_file}`.")
+            return cache_body
+        if cache_etag:
+            request_headers['If-None-Match'] = cache_etag
+
+    logger.debug(f"Fetching {package} package metadata from https://{PYPI_HOST}{package_json_path}.")
+    response, body = get_pypi_response(package_json_path, request_headers)
+    if response.status == http.HTTPStatus.NOT_MODIFIED:
+        logger.debug(f"Using unchanged {package} package metadata cached in `{cache_file}`.")
+        try:
+            # Mark the cached copy as fresh again.
+            os.utime(cache_file)
+        except OSError as error:
+            logger.debug(f"Error updating the modification time of `{cache_file}`:  {error}")
+        return cache_body
+
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # Write to a uniquely named temporary file first so other dbtenv processes and threads never read a partially
+        # written cache file or write to the same temporary file.
+        temp_cache_file_descriptor, temp_cache_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+        try:
+            with os.fdopen(temp_cache_file_descriptor, 'wb') as file:
+                file.write(response.headers.get('ETag', '').encode('latin-1'))
+                file.write(b'\n')
+                file.write(body)
+            os.replace(temp_cache_file, cache_file)
+        except OSError:
+            os.remove(temp_cache_file)
+            raise
+    except OSError as error:
+        logger.debug(f"Error caching {package} package metadata in `{cache_file}`:  {error}")
+
+    return body
+
+
+@functools.lru_cache(maxsize=None)
+def get_json_parser() -> Callable[[bytes], Any]:
+    try:
+        # orjson parses large package metadata considerably faster, so use it if it's installed.
+        import orjson
+        return orjson.loads
+    except ImportError:
+        import json
+        return json.loads
+
+
+_pypi_package_metadata_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def get_pypi_package_metadata(env: Environment, package: str, revalidate: bool = False) -> Dict[str, Any]:
+    # The same package's metadata can be needed several times in one run (e.g. when simulating release dates),
+    # so only parse it once.
+    if revalidate or package not in _pypi_package_metadata_cache:
+        _pypi_package_metadata_cache[package] = get_json_parser()(get_cached_pypi_package_json(env, package, revalidate))
+    return _pypi_package_metadata_cache[package]
+
+def get_pypi_package_versions(env: Environment, adapter_type: str, revalidate: bool = False) -> List[Version]:
+    package_metadata = get_pypi_package_metadata(env, f"dbt-{adapter_type}", revalidate)
+    # Only create Versions for releases which have files that haven't been yanked.
+    return [
+        Version(adapter_type=adapter_type, version=version)
+        for version, files in package_metadata['releases'].items()
+        if any(not file['yanked'] for file in files)
+    ]
+
+def get_pypi_all_dbt_package_versions(env: Environment) -> List[Version]:
+    import concurrent.futures
+
+    # Each worker thread keeps its own connections alive across the packages it fetches, so they're collected to be
+    # closed once all the workers have finished.
+    worker_connections: Dict[int, Dict[str, 'http.client.HTTPSConnection']] = {}
+
+    def get_adapter_versions(adapter_type: str) -> List[Version]:
+        worker_connections[threading.get_ident()] = get_pypi_connections()
+        return get_pypi_package_versions(env, adapter_type)
+
+    try:
+        # Fetching each adapter's package metadata is almost entirely waiting on pypi.org, so do it concurrently.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=PYPI_MAX_CONCURRENT_REQUESTS) as executor:
+            adapter_versions = list(executor.map(get_adapter_versions, DBT_ADAPTER_TYPES))
+    finally:
+        for connections in worker_connections.values():
+            for connection in connections.values():
+                connection.close()
+    return list(itertools.chain.from_iterable(adapter_versions))
+
+
+def is_running_python(python: str) -> bool:
+    """Return whether the Python executable belongs to the same Python installation dbtenv is running with."""
+    return os.path.realpath(python) == os.path.realpath(getattr(sys, '_base_executable', sys.executable))
+
+
+_python_version_cache: Dict[str, Tuple[int, int, str]] = {}
 
-def get_pypi_all_dbt_package_versions() -> List[Version]:
-    versions = []
-    for adapter_type in DBT_ADAPTER_TYPES:
-        versions += get_pypi_package_versions(adapter_type)
-    return versions
+
+def get_python_version(python: str) -> Tuple[int, int, str]:
+    """Return the major version, minor version, and full version of the Python executable."""
+    python_path = os.path.realpath(python)
+    if python_path not in _python_version_cache:
+        if is_running_python(python):
+            # No need to start another Python interpreter just to ask it what version it is.
+            _python_version_cache[python_path] = (sys.version_info.major, sys.version_info.minor, platform.python_version())
+        else:
+            # Not closing file descriptors lets subprocess use posix_spawn() where available rather than fork() and exec(),
+            # and file descriptors aren't inheritable by default anyway.
+            python_version_result = subprocess.run([python, '--version'], stdout=subprocess.PIPE, close_fds=False)
+            if python_version_result.returncode != 0:
+                raise DbtenvError(f"Failed to run `{python}`.")
+            python_version_output = python_version_result.stdout.decode('utf-8').strip()
+            # The output has a fixed "Python <major>.<minor>.<micro>" shape, so there's no need for a regex to parse it.
+            python_version = python_version_output.partition(' ')[2]
+            python_version_parts = python_version.split('.')
+            try:
+                _python_version_cache[python_path] = (int(python_version_parts[0]), int(python_version_parts[1]), python_version)
+            except (IndexError, ValueError):
+                raise DbtenvError(f"No Python version number found in \"{python_version_output}\".")
+
+    return _python_version_cache[python_path]
+
+
+def remove_directory_tree(env: Environment, path: str) -> None:
+    """Delete a directory and everything in it, like shutil.rmtree() but faster for large virtual environments."""
+    if os.path.islink(path):
+        # Only remove the symlink itself, never the contents of the directory it points to.
+        os.unlink(path)
+        return
+
+    if env.os == 'Windows':
+        shutil.rmtree(path)
+    else:
+        _remove_directory_tree_in_inode_order(path)
+
+
+def _remove_directory_tree_in_inode_order(path: str) -> None:
+    # Deleting directory entries in inode order is significantly faster on common file systems than deleting them in
+    # directory order (the same approach GNU coreutils' `rm` takes), and scandir() gets each entry's inode number and
+    # type as it reads the directory, so no extra stat() calls are needed.
+    with os.scandir(path) as directory_scan:
+        entries = sorted(directory_scan, key=lambda entry: entry.inode())
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            _remove_directory_tree_in_inode_order(entry.path)
+        else:
+            os.unlink(entry.path)
+    os.rmdir(path)
 
 
 class PipDbt(Dbt):
@@ -89,26 +333,52 @@ class PipDbt(Dbt):
             else:
                 raise DbtenvError(f"`{self.venv_directory}` already exists.")
 
-        available_adapter_versions = get_pypi_package_versions(adapter_type=self.version.adapter_type)
-        if self.version not in available_adapter_versions:
-            logger.info(f"{self.version} is not available for installation from pypi. Try one of {[v.pypi_version for v in available_adapter_versions]}")
-            return
+        if not package_location:
+            # There's no need to check pypi.org when installing from somewhere else (which may well be offline).
+            available_adapter_versions = get_pypi_package_versions(self.env, adapter_type=self.version.adapter_type)
+            if self.version not in available_adapter_versions:
+                # The version may have been released since the package metadata was cached.
+                available_adapter_versions = get_pypi_package_versions(self.env, adapter_type=self.version.adapter_type, revalidate=True)
+            if self.version not in available_adapter_versions:
+                logger.info(f"{self.version} is not available for installation from pypi. Try one of {[v.pypi_version for v in available_adapter_versions]}")
+                return
 
         python = self.env.python
         self._check_python_compatibility(python)
 
+        # uv is a much faster drop-in replacement for `pip install`, but it doesn't read pip's configuration (e.g. a
+        # custom index URL), so it's only used when it's been chosen as the installer.
+        uv = None
+        if self.env.primary_installer == Installer.UV:
+            uv = shutil.which('uv')
+            if not uv:
+                raise DbtenvError(f"uv was chosen as the installer using {dbtenv.DEFAULT_INSTALLER_VAR}, but no uv executable was found.")
+
         logger.info(f"Creating virtual environment in `{self.venv_directory}` using `{python}`.")
-        venv_result = subprocess.run([python, '-m' 'venv', '--clear', self.venv_directory])
-        if venv_result.returncode != 0:
-            raise DbtenvError(f"Failed to create virtual environment in `{self.venv_directory}`.")
+        # uv doesn't need pip in the virtual environment, and bootstrapping pip is the slowest part of creating one.
+        self._create_venv(python, with_pip=(not uv))
 
         try:
-            pip = self._find_pip()
-            # Upgrade pip to avoid problems with packages that might require newer pip features.
-            subprocess.run([pip, 'install', '--upgrade', 'pip'])
-            # Install wheel to avoid pip falling back to using legacy `setup.py` installs.
-            subprocess.run([pip, 'install', '--disable-pip-version-check', 'wheel'])
-            pip_args = ['install', '--disable-pip-version-check']
+            pip_install_args = ['install', '--disable-pip-version-check']
+            if self.env.quiet and not self.env.debug:
+                # pip's output is nonessential, so only show warnings and errors from it.
+                pip_install_args.append('--quiet')
+            if uv:
+                # uv doesn't use the virtual environment's pip or wheel, so there's no need to upgrade them first.
+                pip_command = [uv, 'pip']
+                pip_install_args.extend(['--python', self._get_python()])
+            else:
+                pip = self._get_pip()
+                pip_command = [pip]
+                # Upgrade pip to avoid problems with packages that might require newer pip features, and install wheel
+                # to avoid pip falling back to using legacy `setup.py` installs. Both need to be done before installing
+                # dbt so they take effect for it, but they can be done in the same pip invocation.  pip's --upgrade option
+                # applies to every package being installed, so that also upgrades wheel if it's somehow already installed.
+                try:
+                    subprocess.run([pip, *pip_install_args, '--upgrade', 'pip', 'wheel'])
+                except FileNotFoundError:
+                    raise DbtenvError(f"No pip executable found in `{self.venv_directory}`.")
+            pip_args = pip_install_args.copy()
             if package_location:
                 package_source = f"`{package_location}`"
                 if editable:
@@ -116,25 +386,36 @@ class PipDbt(Dbt):
                 pip_args.append(package_location)
             else:
                 package_source = "the Python Package Index"
+                if not uv:
+                    # Prefer an older wheel over a newer source distribution of a dependency, as building from source is
+                    # slow and can fail due to missing build tools, while still allowing source builds when there's no
+                    # wheel.  uv doesn't support this option.
+                    pip_args.append('--prefer-binary')
                 if self.env.simulate_release_date:
-                    package_metadata = get_pypi_package_metadata('dbt')
+                    from datetime import date
+                    package_metadata = get_pypi_package_metadata(self.env, 'dbt')
                     release_date = date.fromisoformat(package_metadata['releases'][self.version.pypi_version][0]['upload_time'][:10])
                     logger.info(f"Simulating release date {release_date} for dbt {self.version}.")
+                    # The proxy's HTTP server modules are only needed when simulating a release date.
+                    import http.server
+                    from dbtenv.pypi_proxy import BaseDateFilterPyPIRequestHandler
                     class ReleaseDateFilterPyPIRequestHandler(BaseDateFilterPyPIRequestHandler):
+                        env = self.env
                         date = release_date
-                    pip_filter_server = http.server.HTTPServer(('', 0), ReleaseDateFilterPyPIRequestHandler)
+                    # pip is the only client, so only listen locally, and handle its requests concurrently since it can
+                    # download several files at once.  ThreadingHTTPServer uses daemon threads for requests.
+                    pip_filter_server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), ReleaseDateFilterPyPIRequestHandler)
                     pip_filter_port = pip_filter_server.socket.getsockname()[1]
                     threading.Thread(target=pip_filter_server.serve_forever, daemon=True).start()
-                    pip_args.extend(['--index-url', f'http://localhost:{pip_filter_port}/simple'])
-                if self.version.pypi_version < '0.19.1':
-                    # Versions prior to 0.19.1 just specified agate>=1.6, but agate 1.6.2 introduced a dependency on PyICU
-                    # which causes installation problems, so exclude that like versions 0.19.1 and above do.
-                    pip_args.append('agate>=1.6,<1.6.2')
-                if '0.16.0' > self.version.pypi_version >= '0.15.0':
+                    pip_args.extend(['--index-url', f'http://127.0.0.1:{pip_filter_port}/simple'])
+                if version_is_before(self.version, AGATE_CONSTRAINT_BEFORE_VERSION):
+                    # Versions 0.19.1 and above exclude agate 1.6.2 themselves, so only older versions need the constraint.
+                    pip_args.append(AGATE_CONSTRAINT)
+                if version_is_before(self.version, (0, 16, 0)) and not version_is_before(self.version, (0, 15, 0)):
                     # Versions ~=0.15.0 just specified Jinja2>=2.10, but dbt versions ~=0.15.0 are not compatible with
                     # Jinja >= 3.0.0. https://github.com/dbt-labs/dbt-core/issues/2147
                     pip_args.append('Jinja2<3')
-                if self.version.pypi_version >= '0.15.0' < '1.0.0':
+                if not version_is_before(self.version, (0, 15, 0)):
                     # Deprecation of soft_unicode in MarkupSafe==2.1.0 is not supported by Jinja2==2.11
                     # https://github.com/dbt-labs/dbt-core/pull/4746
                     pip_args.append('MarkupSafe==2.0.1')
@@ -142,62 +423,89 @@ class PipDbt(Dbt):
                 pip_args.append(self.version.pip_specifier)
             logger.info(f"Installing {self.version.pip_specifier} from {package_source} into `{self.venv_directory}`.")
 
-            logger.info(f"Running `{pip}` with arguments {pip_args}.")
-            pip_result = subprocess.run([pip, *pip_args])
+            logger.info(f"Running `{' '.join(pip_command)}` with arguments {pip_args}.")
+            pip_result = subprocess.run([*pip_command, *pip_args])
             if pip_result.returncode != 0:
                 raise DbtenvError(f"Failed to install dbt {self.version.pypi_version} from {package_source} into `{self.venv_directory}`.")
         except Exception as e:
-            shutil.rmtree(self.venv_directory)
+            remove_directory_tree(self.env, self.venv_directory)
             raise(e)
 
         logger.info(f"Successfully installed {self.version} from {package_source} into `{self.venv_directory}`.")
 
     def _check_python_compatibility(self, python: str) -> None:
-        python_version_result = subprocess.run([python, '--version'], stdout=subprocess.PIPE)
-        if python_version_result.returncode != 0:
-            raise DbtenvError(f"Failed to run `{python}`.")
-        python_version_output = python_version_result.stdout.decode('utf-8').strip()
-        python_version_match = re.search(r'(?P<major_version>\d+)\.(?P<minor_version>\d+)\.\d+', python_version_output)
-        if not python_version_match:
-            raise DbtenvError(f"No Python version number found in \"{python_version_output}\".")
-        python_version = python_version_match[0]
-        python_major_version = int(python_version_match['major_version'])
-        python_minor_version = int(python_version_match['minor_version'])
-
-        if self.version.pypi_version < '0.20' and (python_major_version, python_minor_version) >= (3, 9):
+        python_major_version, python_minor_version, python_version = get_python_version(python)
+
+        if version_is_before(self.version, (0, 20, 0)) and (python_major_version, python_minor_version) >= (3, 9):
             raise DbtenvError(
                 f"Python {python_version} is being used, but dbt versions before 0.20.0 aren't compatible with Python 3.9 or above."
             )
-        elif self.version.pypi_version < '0.15' and (python_major_version, python_minor_version) >= (3, 8):
+        elif version_is_before(self.version, (0, 15, 0)) and (python_major_version, python_minor_version) >= (3, 8):
             raise DbtenvError(
                 f"Python {python_version} is being used, but dbt versions before 0.15 aren't compatible with Python 3.8 or above."
             )
 
         logger.debug(f"Python {python_version} should be compatible with dbt.")
 
-    def _find_pip(self) -> str:
-        pip_subpath = 'Scripts\\pip.exe' if self.env.os == 'Windows' else 'bin/pip'
-        pip_path = os.path.join(self.venv_directory, pip_subpath)
-        if os.path.isfile(pip_path):
-            logger.debug(f"Found pip executable `{pip_path}`.")
-            return pip_path
+    def _create_venv(self, python: str, with_pip: bool = True) -> None:
+        # Before Python 3.11, when dbtenv is itself running in a virtual environment (e.g. when installed with pipx) the venv
+        # module would base the new virtual environment on dbtenv's virtual environment rather than the base Python
+        # installation, so it would break whenever dbtenv was reinstalled or removed.
+        can_create_venv_in_process = sys.version_info >= (3, 11) or sys.prefix == sys.base_prefix
+        if can_create_venv_in_process and is_running_python(python):
+            # The virtual environment would be based on the same Python installation dbtenv is running with,
+            # so create it in-process rather than starting up another Python interpreter to do it.
+            import venv
+            try:
+                venv.EnvBuilder(clear=True, symlinks=(os.name != 'nt'), with_pip=with_pip).create(self.venv_directory)
+            except (OSError, subprocess.CalledProcessError) as error:
+                raise DbtenvError(f"Failed to create virtual environment in `{self.venv_directory}`:  {error}")
         else:
-            raise DbtenvError(f"No pip executable found in `{self.venv_directory}`.")
+            venv_args = ['--clear'] if with_pip else ['--clear', '--without-pip']
+            venv_result = subprocess.run([python, '-m', 'venv', *venv_args, self.venv_directory])
+            if venv_result.returncode != 0:
+                raise DbtenvError(f"Failed to create virtual environment in `{self.venv_directory}`.")
+
+    def _get_pip(self) -> str:
+        # We've just created the virtual environment so we know where pip should be, and rather than checking it exists
+        # here we let the first pip invocation fail if it doesn't.
+        pip_subpath = 'Scripts\\pip.exe' if self.env.os == 'Windows' else 'bin/pip'
+        return os.path.join(self.venv_directory, pip_subpath)
 
-    def get_executable(self) -> str:
-        if self._executable is None:
-            if not os.path.isdir(self.venv_directory):
-                raise DbtenvError(f"No dbt {self.version.pypi_version} installation found in `{self.venv_directory}`.")
+    def _get_python(self) -> str:
+        python_subpath = 'Scripts\\python.exe' if self.env.os == 'Windows' else 'bin/python'
+        return os.path.join(self.venv_directory, python_subpath)
 
+    def _try_find_executable(self) -> Optional[str]:
+        if self._executable is None:
             dbt_subpath = 'Scripts\\dbt.exe' if self.env.os == 'Windows' else 'bin/dbt'
             dbt_path = os.path.join(self.venv_directory, dbt_subpath)
-            if os.path.isfile(dbt_path):
+            # Checking for the executable directly covers the common case with a single syscall.
+            if self.env.os == 'Windows':
+                # Windows doesn't have an executable permission, so we can only check that the file exists.
+                dbt_found = os.path.isfile(dbt_path)
+            else:
+                dbt_found = os.access(dbt_path, os.X_OK)
+            if dbt_found:
                 logger.debug(f"Found dbt executable `{dbt_path}`.")
                 self._executable = dbt_path
+
+        return self._executable
+
+    def get_executable(self) -> str:
+        executable = self._try_find_executable()
+        if executable is None:
+            # We only need to check the virtual environment directory to explain why the executable wasn't found.
+            if not os.path.isdir(self.venv_directory):
+                raise DbtenvError(f"No dbt {self.version.pypi_version} installation found in `{self.venv_directory}`.")
             else:
                 raise DbtenvError(f"No dbt executable found in `{self.venv_directory}`.")
 
-        return self._executable
+        return executable
+
+    def is_installed(self) -> bool:
+        # Not being installed is a common case, so this avoids raising and handling an error for it.
+        return self._try_find_executable() is not None
 
     def execute(self, args: List[str]) -> None:
         try:
@@ -207,22 +515,25 @@ class PipDbt(Dbt):
             # One common way that can happen is if a Homebrew-installed Python was used and subsequently upgraded.
             executable_dir = os.path.dirname(self._executable)
             with os.scandir(executable_dir) as executable_dir_scan:
-                broken_python_symlinks = [
-                    entry
-                    for entry in executable_dir_scan
-                    if entry.name.startswith('python')
-                        and entry.is_symlink()
-                        and os.path.sep in os.readlink(entry.path)  # Ignore local symlinks like `python` -> `python3`.
-                        and not os.path.exists(entry.path)
-                ]
-            if broken_python_symlinks:
-                broken_symlink = broken_python_symlinks[0]
+                # We only need to find the first broken symlink.
+                broken_symlink = next(
+                    (
+                        entry
+                        for entry in executable_dir_scan
+                        if entry.name.startswith('python')
+                            and entry.is_symlink()
+                            and os.path.sep in os.readlink(entry.path)  # Ignore local symlinks like `python` -> `python3`.
+                            and not os.path.exists(entry.path)
+                    ),
+                    None
+                )
+            if broken_symlink:
                 broken_symlink_target = os.readlink(broken_symlink.path)
                 logger.error(
                     f"The virtual environment for dbt {self.version.pypi_version} is broken because the"
                     f" `{broken_symlink.path}` symlink points to `{broken_symlink_target}`, which no longer exists."
                 )
-                if dbtenv.string_is_true(input(f"Reinstall dbt {self.version.pypi_version} using `{self.env.python}`? ")):
+                if dbtenv.confirm(f"Reinstall dbt {self.version.pypi_version} using `{self.env.python}`? "):
                     self.install(force=True)
                     return super().execute(args)
             raise
@@ -231,72 +542,7 @@ class PipDbt(Dbt):
         if not self.is_installed():
             raise DbtenvError(f"No dbt {self.version.pypi_version} installation found in `{self.venv_directory}`.")
 
-        if force or dbtenv.string_is_true(input(f"Uninstall `{self.venv_directory}`? ")):
-            shutil.rmtree(self.venv_directory)
+        if force or dbtenv.confirm(f"Uninstall `{self.venv_directory}`? "):
+            remove_directory_tree(self.env, self.venv_directory)
             self._executable = None
             logger.info(f"Successfully uninstalled dbt {self.version.pypi_version} from `{self.venv_directory}`.")
-
-
-class BaseDateFilterPyPIRequestHandler(http.server.BaseHTTPRequestHandler):
-    """
-    HTTP request handler that proxies PEP 503-compliant requests to pypi.org and excludes files uploaded after self.date.
-
-    self.date needs to be manually defined when this class is subclassed (we can't pass the date to use via a
-    constructor argument because the HTTPServer code instantiates request handlers in a very specific way).
-    """
-
-    def do_GET(self) -> None:
-        logger.debug(f"Handling pypi.org request:  {self.requestline}")
-        package_match = re.search(r'^/simple/(?P<package>[^/]+)', self.path)
-
-        passthrough_request_headers = {
-            header: value
-            for header, value in self.headers.items()
-            if header in ('User-Agent', 'Accept', 'Cache-Control')
-        }
-        pypi_request = urllib.request.Request(f'https://pypi.org{self.path}', headers=passthrough_request_headers)
-        with urllib.request.urlopen(pypi_request) as pypi_response:
-            pypi_response_status  = pypi_response.status
-            pypi_response_headers = pypi_response.headers
-            pypi_response_body    = pypi_response.read()
-
-        if (pypi_response_status != http.HTTPStatus.OK or not package_match):
-            logger.debug(f"Passing through pypi.org {pypi_response_status} response for {self.path}.")
-            self.send_response(pypi_response_status)
-            for header, value in pypi_response_headers.items():
-                self.send_header(header, value)
-            self.end_headers()
-            self.wfile.write(pypi_response_body)
-            return
-
-        package = package_match['package']
-        package_metadata = get_pypi_package_metadata(package)
-        excluded_file_names = set(
-            file['filename']
-            for files in package_metadata['releases'].values()
-            for file in files
-            if date.fromisoformat(file['upload_time'][:10]) > self.date
-        )
-        file_link_pattern = r'<a href=[^>]+>(?P<file_name>[^<]+)</a>'
-        excluded_file_link_count = 0
-        def exclude_file_links(link_match: re.Match) -> str:
-            nonlocal excluded_file_link_count
-            if link_match['file_name'].strip() in excluded_file_names:
-                excluded_file_link_count += 1
-                return ''
-            else:
-                return link_match[0]
-        modified_response_body = re.sub(file_link_pattern, exclude_file_links, pypi_response_body.decode('utf-8')).encode('utf-8')
-        logger.debug(f"Excluded {excluded_file_link_count} files for {package} after {self.date}.")
-
-        self.send_response(pypi_response_status)
-        for header, value in pypi_response_headers.items():
-            if header != 'Content-Length':
-                self.send_header(header, value)
-        self.send_header('Content-Length', len(modified_response_body))
-        self.end_headers()
-        self.wfile.write(modified_response_body)
-
-    def log_request(self, code: Union[int, str] = '-', size: Union[int, str] = '-') -> None:
-        # We're already logging requests in do_GET(), so don't log them again here.
-        pass
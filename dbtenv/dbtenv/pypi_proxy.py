@@ -0,0 +1,102 @@
+# Standard library
+from datetime import date
+import http
+import http.server
+import re
+import shutil
+from typing import Dict, FrozenSet, Tuple, Union
+import urllib.request
+
+# Local
+import dbtenv
+from dbtenv.pip import get_pypi_package_metadata
+
+
+logger = dbtenv.LOGGER
+
+
+PROXY_RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# Matches package paths and file links in the PEP 503 simple repository API.
+SIMPLE_PACKAGE_PATH_PATTERN = re.compile(r'^/simple/(?P<package>[^/]+)')
+FILE_LINK_PATTERN = re.compile(rb'<a href=[^>]+>(?P<file_name>[^<]+)</a>')
+
+
+class BaseDateFilterPyPIRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    HTTP request handler that proxies PEP 503-compliant requests to pypi.org and excludes files uploaded after self.date.
+
+    self.env and self.date need to be manually defined when this class is subclassed (we can't pass them via
+    constructor arguments because the HTTPServer code instantiates request handlers in a very specific way).
+    """
+
+    # pip can request the same package's index several times, so the excluded file names for each package and date are
+    # only computed once.
+    _excluded_file_names_cache: Dict[Tuple[str, date], FrozenSet[bytes]] = {}
+
+    def get_excluded_file_names(self, package: str) -> FrozenSet[bytes]:
+        cache_key = (package, self.date)
+        if cache_key not in self._excluded_file_names_cache:
+            package_metadata = get_pypi_package_metadata(self.env, package)
+            # Upload times start with an ISO 8601 date, so they can be compared to the date as strings.
+            date_string = self.date.isoformat()
+            self._excluded_file_names_cache[cache_key] = frozenset(
+                file['filename'].encode('utf-8')
+                for files in package_metadata['releases'].values()
+                for file in files
+                if file['upload_time'][:10] > date_string
+            )
+        return self._excluded_file_names_cache[cache_key]
+
+    def do_GET(self) -> None:
+        logger.debug(f"Handling pypi.org request:  {self.requestline}")
+        package_match = SIMPLE_PACKAGE_PATH_PATTERN.search(self.path)
+
+        passthrough_request_headers = {
+            header: value
+            for header, value in self.headers.items()
+            if header in ('User-Agent', 'Accept', 'Cache-Control')
+        }
+        pypi_request = urllib.request.Request(f'https://pypi.org{self.path}', headers=passthrough_request_headers)
+        with urllib.request.urlopen(pypi_request) as pypi_response:
+            pypi_response_status  = pypi_response.status
+            pypi_response_headers = pypi_response.headers
+
+            if (pypi_response_status != http.HTTPStatus.OK or not package_match):
+                logger.debug(f"Passing through pypi.org {pypi_response_status} response for {self.path}.")
+                self.send_response(pypi_response_status)
+                for header, value in pypi_response_headers.items():
+                    self.send_header(header, value)
+                self.end_headers()
+                # There's no need to buffer responses we aren't modifying.
+                shutil.copyfileobj(pypi_response, self.wfile, PROXY_RESPONSE_CHUNK_SIZE)
+                return
+
+            pypi_response_body = pypi_response.read()
+
+        package = package_match['package']
+        excluded_file_names = self.get_excluded_file_names(package)
+        # Copy the response body in chunks between the excluded file links, working with the bytes directly.
+        modified_response_body_parts = []
+        body_position = 0
+        excluded_file_link_count = 0
+        for link_match in FILE_LINK_PATTERN.finditer(pypi_response_body):
+            if link_match['file_name'].strip() in excluded_file_names:
+                modified_response_body_parts.append(pypi_response_body[body_position:link_match.start()])
+                body_position = link_match.end()
+                excluded_file_link_count += 1
+        modified_response_body_parts.append(pypi_response_body[body_position:])
+        modified_response_body = b''.join(modified_response_body_parts)
+        logger.debug(f"Excluded {excluded_file_link_count} files for {package} after {self.date}.")
+
+        self.send_response(pypi_response_status)
+        for header, value in pypi_response_headers.items():
+            if header.lower() != 'content-length':
+                self.send_header(header, value)
+        self.send_header('Content-Length', len(modified_response_body))
+        self.end_headers()
+        self.wfile.write(modified_response_body)
+
+    def log_request(self, code: Union[int, str] = '-', size: Union[int, str] = '-') -> None:
+        # We're already logging requests in do_GET(), so don't log them again here.
+        pass
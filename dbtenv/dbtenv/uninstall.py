@@ -5,7 +5,6 @@ from typing import List
 # Local
 import dbtenv
 from dbtenv import Args, DbtenvError, Subcommand, Version
-import dbtenv.pip
 
 
 logger = dbtenv.LOGGER
@@ -16,12 +15,13 @@ class UninstallSubcommand(Subcommand):
 
     name = 'uninstall'
 
-    def add_args_parser(self, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
+    @classmethod
+    def add_args_parser(cls, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
         parser = subparsers.add_parser(
-            self.name,
+            cls.name,
             parents=parent_parsers,
-            description=self.__doc__,
-            help=self.__doc__
+            description=cls.__doc__,
+            help=cls.__doc__
         )
         parser.add_argument(
             '-f',
@@ -37,6 +37,8 @@ class UninstallSubcommand(Subcommand):
         )
 
     def execute(self, args: Args) -> None:
+        import dbtenv.pip
+
         version = Version(pip_specifier=args.dbt_pip_specifier)
         attempted_uninstalls = 0
 
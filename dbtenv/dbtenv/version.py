@@ -1,18 +1,15 @@
 # Standard library
 import argparse
-import glob
+import copy
+import operator
 import os.path
 import re
 import traceback
-from typing import Collection, List, Optional, Tuple
-
-# External Libraries
-import yaml
+from typing import Any, Collection, Dict, List, Optional, Tuple
 
 # Local
 import dbtenv
 from dbtenv import Args, DbtenvError, Environment, Subcommand, Version
-import dbtenv.install
 import dbtenv.versions
 
 
@@ -24,15 +21,16 @@ class VersionSubcommand(Subcommand):
 
     name = 'version'
 
-    def add_args_parser(self, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
+    @classmethod
+    def add_args_parser(cls, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
         parser = subparsers.add_parser(
-            self.name,
+            cls.name,
             parents=parent_parsers,
             description="""
                 Show the dbt version automatically detected from the environment, show/set the dbt version globally
                 or for the local directory, or show the dbt version for the current dbt project or shell.
             """,
-            help=self.__doc__
+            help=cls.__doc__
         )
         scope_group = parser.add_mutually_exclusive_group()
         scope_group.add_argument(
@@ -71,11 +69,12 @@ class VersionSubcommand(Subcommand):
     def execute(self, args: Args) -> None:
         if args.global_dbt_version is not None:
             if args.global_dbt_version != '':
-                if bool(re.search(r"^(dbt-.+)==(.+)$", args.global_dbt_version)):
+                if bool(dbtenv.PIP_SPECIFIER_PATTERN.search(args.global_dbt_version)):
                     version = Version(pip_specifier=args.global_dbt_version)
+                    import dbtenv.install
                     dbtenv.install.ensure_dbt_is_installed(self.env, version)
                     set_global_version(self.env, version.pip_specifier)
-                elif bool(re.search(r"^[0-9\.]+[a-z0-9]*$", args.global_dbt_version)):
+                elif bool(dbtenv.VERSION_NUMBER_PATTERN.search(args.global_dbt_version)):
                     set_global_version(self.env, args.global_dbt_version)
                 else:
                     logger.info("Argument value doesn't match a dbt version (e.g. 1.0.0) or full pip specifier (e.g. dbt-snowflake==1.0.0).")
@@ -88,11 +87,12 @@ class VersionSubcommand(Subcommand):
                     logger.info(f"No global dbt version has been set using the `{dbtenv.GLOBAL_VERSION_FILE}` file.")
         elif args.local_dbt_version is not None:
             if args.local_dbt_version != '':
-                if bool(re.search(r"^(dbt-.+)==(.+)$", args.local_dbt_version)):
+                if bool(dbtenv.PIP_SPECIFIER_PATTERN.search(args.local_dbt_version)):
                     version = Version(pip_specifier=args.local_dbt_version)
+                    import dbtenv.install
                     dbtenv.install.ensure_dbt_is_installed(self.env, version)
                     set_local_version(self.env, version.pip_specifier)
-                elif bool(re.search(r"^[0-9\.]+[a-z0-9]*$", args.local_dbt_version)):
+                elif bool(dbtenv.VERSION_NUMBER_PATTERN.search(args.local_dbt_version)):
                     set_local_version(self.env, args.local_dbt_version)
                 else:
                     logger.info("Argument value doesn't match a dbt version (e.g. 1.0.0) or full pip specifier (e.g. dbt-snowflake==1.0.0).")
@@ -135,9 +135,9 @@ class VersionSubcommand(Subcommand):
 def read_version_file(file_path: str, adapter_type: Optional[str], source_description: str) -> Optional[Version]:
     with open(file_path, 'r') as file:
         value = file.readline().strip()
-        if bool(re.search(r"^(dbt-.+)==(.+)$", value)):
+        if bool(dbtenv.PIP_SPECIFIER_PATTERN.search(value)):
             return Version(pip_specifier=value, source=file_path, source_description=source_description)
-        elif bool(re.search(r"^[0-9\.]+[a-z0-9]*$", value)):
+        elif bool(dbtenv.VERSION_NUMBER_PATTERN.search(value)):
             if adapter_type:
                 return Version(adapter_type=adapter_type, version=value, source=file_path, source_description=source_description)
         else:
@@ -149,9 +149,10 @@ def write_version_file(file_path: str, value: str) -> None:
 
 
 def try_get_global_version(env: Environment, adapter_type: Optional[str]) -> Optional[Version]:
-    if os.path.isfile(env.global_version_file):
+    # Just trying to read the file saves checking whether it exists first.
+    try:
         return read_version_file(env.global_version_file, adapter_type, f"set by global version file {env.global_version_file}")
-    else:
+    except (FileNotFoundError, IsADirectoryError):
         return None
 
 
@@ -177,20 +178,50 @@ def set_local_version(env: Environment, value: str) -> None:
 def try_get_shell_version(env: Environment, adapter_type: Optional[str]) -> Optional[Version]:
     if dbtenv.DBT_VERSION_VAR in env.env_vars:
         value = env.env_vars[dbtenv.DBT_VERSION_VAR]
-        if bool(re.search(r"^(dbt-.+)==(.+)$", value)):
+        if bool(dbtenv.PIP_SPECIFIER_PATTERN.search(value)):
             return Version(pip_specifier=value)
-        elif bool(re.search(r"^[0-9\.]+[a-z0-9]*$", value)):
+        elif bool(dbtenv.VERSION_NUMBER_PATTERN.search(value)):
             if adapter_type:
                 return Version(adapter_type=adapter_type, version=value)
         else:
             raise(DbtenvError(f"Invalid value in {dbtenv.DBT_VERSION_VAR} environment variable: {value}"))
 
 
+_yaml_file_cache: Dict[Tuple[str, int, int], Any] = {}
+
+
+def load_yaml_file(file_path: str) -> Any:
+    # The same YAML files (e.g. dbt_project.yml) can be needed several times in one run, so only parse them once unless
+    # they change.
+    file_stat = os.stat(file_path)
+    cache_key = (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+    if cache_key not in _yaml_file_cache:
+        # PyYAML is only imported once there's a YAML file to parse, as many commands don't need to.
+        import yaml
+        # The LibYAML-based loader is much faster, but is only available if PyYAML was built with LibYAML.
+        yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(file_path) as file:
+            _yaml_file_cache[cache_key] = yaml.load(file, Loader=yaml_loader)
+    return _yaml_file_cache[cache_key]
+
+
+VERSION_REQUIREMENT_PATTERN = re.compile(r'(?P<operator>[<>=]=?)?(?P<version>.+)')
+
+VERSION_REQUIREMENT_OPERATORS = {
+    '<':  operator.lt,
+    '<=': operator.le,
+    '>':  operator.gt,
+    '>=': operator.ge,
+}
+
+
 class VersionRequirement:
     def __init__(self, adapter_type: str, requirement: str, source: str) -> None:
         self.requirement = requirement
-        requirement_match = re.match(r'(?P<operator>[<>=]=?)?(?P<version>.+)', requirement)
+        requirement_match = VERSION_REQUIREMENT_PATTERN.match(requirement)
         self.operator = requirement_match['operator'] or '=='
+        # Look up the comparison once rather than every time a version is checked against the requirement.
+        self._compare = VERSION_REQUIREMENT_OPERATORS.get(self.operator, operator.eq)
         self.version = Version(adapter_type=adapter_type, version=requirement_match['version'])
         self.source = source
 
@@ -198,22 +229,12 @@ class VersionRequirement:
         return self.version.name + self.requirement
 
     def is_compatible_with(self, version: Version) -> bool:
-        if self.operator == '<':
-            return version < self.version
-        elif self.operator == '<=':
-            return version <= self.version
-        elif self.operator == '>':
-            return version > self.version
-        elif self.operator == '>=':
-            return version >= self.version
-        else:
-            return version == self.version
+        return self._compare(version, self.version)
 
 
 def try_get_project_version_requirements(project_file: str, adapter_type: str) -> List[VersionRequirement]:
     try:
-        with open(project_file) as file:
-            project_file_yml = yaml.safe_load(file)
+        project_file_yml = load_yaml_file(project_file)
 
         requirements = project_file_yml.get("require-dbt-version")
         if requirements:
@@ -229,28 +250,30 @@ def try_get_project_version_requirements(project_file: str, adapter_type: str) -
 
 def get_max_version(versions: Collection[Version]) -> Version:
     stable_versions = [version for version in versions if version.is_stable]
+    # There's no need to sort the versions just to get the max version.
     if stable_versions:
-        return sorted(stable_versions)[-1]
+        return max(stable_versions)
     else:
-        return sorted(versions)[-1]
+        return max(versions)
 
 
 def try_get_max_compatible_version(versions: Collection[Version], requirements: Collection[VersionRequirement]) -> Optional[Version]:
-    compatible_versions = [
-        version
-        for version in versions
-        if version.is_semantic and all(requirement.is_compatible_with(version) for requirement in requirements)
-    ]
-    if compatible_versions:
-        return get_max_version(compatible_versions)
-    else:
-        return None
+    # Find the max stable and max overall compatible versions in a single pass, like get_max_version() would.
+    max_stable_version = None
+    max_version = None
+    for version in versions:
+        if not version.is_semantic or not all(requirement.is_compatible_with(version) for requirement in requirements):
+            continue
+        if max_version is None or version > max_version:
+            max_version = version
+        if version.is_stable and (max_stable_version is None or version > max_stable_version):
+            max_stable_version = version
+    return max_stable_version or max_version
 
 def try_get_project_adapter_type(project_file: str, target_name: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
     if not project_file:
         return None, "not running inside dbt project"
-    with open(project_file) as file:
-        dbt_project_yml = yaml.safe_load(file)
+    dbt_project_yml = load_yaml_file(project_file)
 
     profile_name = dbt_project_yml["profile"]
 
@@ -259,8 +282,7 @@ def try_get_project_adapter_type(project_file: str, target_name: Optional[str] =
     if not os.path.exists(profiles_yml_filepath):
         return None, f"{profiles_yml_filepath} does not exist"
 
-    with open(profiles_yml_filepath) as file:
-        profiles_yml = yaml.safe_load(file)
+    profiles_yml = load_yaml_file(profiles_yml_filepath)
 
     if not target_name:
         profile = profiles_yml.get(profile_name, {})
@@ -290,15 +312,16 @@ def try_get_project_version(env: Environment, preferred_version: Optional[Versio
     scope_decription = "the dbt project"
 
     if preferred_version:
-        for requirement in all_version_requirements:
-            if not requirement.is_compatible_with(preferred_version):
-                logger.info(
-                    f"Preferred version {preferred_version} ({preferred_version.source_description}) is incompatible with"
-                    f" the {requirement} requirement in `{os.path.relpath(requirement.source, env.project_directory)}`."
-                )
-                break
-        else:
+        incompatible_requirement = next(
+            (requirement for requirement in all_version_requirements if not requirement.is_compatible_with(preferred_version)),
+            None
+        )
+        if incompatible_requirement is None:
             return preferred_version
+        logger.info(
+            f"Preferred version {preferred_version} ({preferred_version.source_description}) is incompatible with"
+            f" the {incompatible_requirement} requirement in `{os.path.relpath(incompatible_requirement.source, env.project_directory)}`."
+        )
 
     installed_versions = dbtenv.versions.get_installed_versions(env, adapter_type=adapter_type)
     compatible_version = try_get_max_compatible_version(installed_versions, all_version_requirements)
@@ -310,6 +333,8 @@ def try_get_project_version(env: Environment, preferred_version: Optional[Versio
     compatible_version = try_get_max_compatible_version(installable_versions, all_version_requirements)
     if compatible_version:
         logger.info(f"{compatible_version} is the latest installable version that is compatible with all version requirements in {scope_decription}.")
+        # The installable versions are shared for the whole run, so set the source on a copy.
+        compatible_version = copy.copy(compatible_version)
         compatible_version.source = ', '.join(requirements_project_files)
         return compatible_version
 
@@ -355,6 +380,7 @@ def get_version(env: Environment, adapter_type: Optional[str] = None) -> Optiona
         return Version(adapter_type=adapter_type, version=max_installed_version.pypi_version, source_description="max installed stable version for current adapter")
 
     installable_versions = dbtenv.versions.get_installable_versions(env, adapter_type=adapter_type)
-    max_installable_version = get_max_version(installable_versions)
+    # The installable versions are shared for the whole run, so set the source description on a copy.
+    max_installable_version = copy.copy(get_max_version(installable_versions))
     max_installable_version.source_description = "max installable stable version for current adapter"
     return max_installable_version
@@ -1,11 +1,10 @@
 # Standard library
 import argparse
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional
 
 # Local
 import dbtenv
 from dbtenv import Args, DbtenvError, Environment, Installer, Subcommand, Version
-import dbtenv.pip
 import dbtenv.version
 
 
@@ -17,12 +16,13 @@ class VersionsSubcommand(Subcommand):
 
     name = 'versions'
 
-    def add_args_parser(self, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
+    @classmethod
+    def add_args_parser(cls, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
         parser = subparsers.add_parser(
-            self.name,
+            cls.name,
             parents=parent_parsers,
-            description=self.__doc__,
-            help=self.__doc__
+            description=cls.__doc__,
+            help=cls.__doc__
         )
         parser.add_argument(
             '-i',
@@ -44,25 +44,40 @@ class VersionsSubcommand(Subcommand):
         if versions:
             active_version = dbtenv.version.get_version(self.env)
             logger.info("+ = installed, * = active")
+            # There can be thousands of versions, so output them all at once rather than line by line.
+            lines = []
             for version in versions:
+                is_active = active_version is not None and version == active_version
                 line = "+ " if version in installed_versions else "  "
-                line += "* " if active_version and version == active_version else "  "
+                line += "* " if is_active else "  "
                 line += version.pip_specifier
-                if active_version and version == active_version:
+                if is_active:
                     line += f"  ({active_version.source_description})"
-                print(line)
+                lines.append(line)
+            print('\n'.join(lines))
         else:
             logger.info(f"No dbt installations found.")
 
 
 def get_installed_versions(env: Environment, adapter_type: Optional[str] = None) -> Set[Version]:
+    # dbtenv.pip is only imported once it's needed, so commands like `dbtenv version --shell` don't have to.
+    import dbtenv.pip
     installed_versions = set()
     installed_versions.update(dbtenv.pip.get_installed_pip_dbt_versions(env, adapter_type=adapter_type))
     return installed_versions
 
 
+_installable_versions_cache: Dict[Optional[str], List[Version]] = {}
+
+
 def get_installable_versions(env: Environment, adapter_type: Optional[str] = None) -> List[Version]:
-    if adapter_type:
-        return dbtenv.pip.get_pypi_package_versions(adapter_type)
-    else:
-        return dbtenv.pip.get_pypi_all_dbt_package_versions()
+    # Resolving the dbt version can need the installable versions more than once, and getting them means fetching
+    # package metadata from pypi.org and parsing every release's version, so only do that once per run.
+    # The returned versions are shared by every caller, so they mustn't be modified.
+    if adapter_type not in _installable_versions_cache:
+        import dbtenv.pip
+        if adapter_type:
+            _installable_versions_cache[adapter_type] = dbtenv.pip.get_pypi_package_versions(env, adapter_type)
+        else:
+            _installable_versions_cache[adapter_type] = dbtenv.pip.get_pypi_all_dbt_package_versions(env)
+    return _installable_versions_cache[adapter_type].copy()
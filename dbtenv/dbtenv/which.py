@@ -4,8 +4,7 @@ from typing import List, Optional
 
 # Local
 import dbtenv
-from dbtenv import Args, Dbt, DbtenvError, Environment, Installer, Subcommand, Version
-import dbtenv.pip
+from dbtenv import Args, Dbt, Environment, Installer, Subcommand, Version
 import dbtenv.version
 
 
@@ -20,16 +19,17 @@ class WhichSubcommand(Subcommand):
 
     name = 'which'
 
-    def add_args_parser(self, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
+    @classmethod
+    def add_args_parser(cls, subparsers: argparse._SubParsersAction, parent_parsers: List[argparse.ArgumentParser]) -> None:
         parser = subparsers.add_parser(
-            self.name,
+            cls.name,
             parents=parent_parsers,
             description=f"""
                 Show the full path to the executable of the specified dbt version or the dbt version automatically
                 detected from the environment based on the global `{dbtenv.GLOBAL_VERSION_FILE}` file, local
                 `{dbtenv.LOCAL_VERSION_FILE}` files, or {dbtenv.DBT_VERSION_VAR} environment variable.
             """,
-            help=self.__doc__
+            help=cls.__doc__
         )
         parser.add_argument(
             'dbt_version',
@@ -56,15 +56,11 @@ class WhichSubcommand(Subcommand):
 
 
 def get_dbt(env: Environment, version: Version) -> Dbt:
-    error = DbtenvError(f"No dbt {version} executable found.")
-
+    # dbtenv.pip is only imported once it's needed, so just importing this module (e.g. for `dbtenv execute`) doesn't.
+    import dbtenv.pip
     pip_dbt = dbtenv.pip.PipDbt(env, version)
     pip_dbt.get_executable()  # Raises an appropriate error if it's not installed.
-
-    if pip_dbt and pip_dbt.is_installed():
-        return pip_dbt
-    else:
-        raise error
+    return pip_dbt
 
 
 def try_get_dbt(env: Environment, version: Version) -> Optional[Dbt]: